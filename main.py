@@ -1,8 +1,7 @@
 #!/usr/bin/env python3
-import sys, json, os, csv
-from math import log
+import sys, json, os
 from datetime import date
-from dateutil.relativedelta import relativedelta
+from functools import lru_cache
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QDoubleSpinBox, QSpinBox, QDateEdit,
@@ -10,15 +9,29 @@ from PyQt6.QtWidgets import (
     QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog, QSizePolicy,
     QMessageBox, QCheckBox, QAbstractSpinBox
 )
-from PyQt6.QtCore import Qt, QDate, QTimer
+from PyQt6.QtCore import Qt, QDate, QTimer, QLocale, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QFont
 import matplotlib
 matplotlib.use("QtAgg")
+# Smooth monotone series: let Agg drop sub-pixel vertices and chunk long paths
+matplotlib.rcParams.update({
+    "path.simplify":           True,
+    "path.simplify_threshold": 0.25,
+    "agg.path.chunksize":      10000,
+})
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib.ticker as mticker
 import numpy as np
 
+try:                                    # optional: faster session (de)serialisation
+    import orjson
+    def _dumps(d) -> bytes: return orjson.dumps(d, option=orjson.OPT_INDENT_2)
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(d) -> bytes: return json.dumps(d, indent=2).encode()
+    _loads = json.loads
+
 # ─────────────────────────────────────────────
 #  COLOUR PALETTE  (charcoal / coal dark theme)
 # ─────────────────────────────────────────────
@@ -39,12 +52,18 @@ CHART_COLORS = [ACCENT, ACCENT2, GREEN, YELLOW, "#54A0FF", "#FF9F43", "#5F27CD"]
 # ─────────────────────────────────────────────
 #  SMART SPINBOX  — select-all on focus / click
 # ─────────────────────────────────────────────
+# One fixed number locale shared by every spinbox: '.' decimals, ',' grouping,
+# independent of the system locale (matches the £ amounts shown everywhere).
+NUM_LOCALE = QLocale.c()
+NUM_LOCALE.setNumberOptions(QLocale.NumberOption.DefaultNumberOptions)
+
 class SmartSpin(QDoubleSpinBox):
     """Double spinbox that selects all text when focused or clicked,
     so typing immediately overwrites the current value."""
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.setLocale(NUM_LOCALE)
         self.setGroupSeparatorShown(True)
         self.setButtonSymbols(QAbstractSpinBox.ButtonSymbols.UpDownArrows)
 
@@ -62,6 +81,7 @@ class SmartIntSpin(QSpinBox):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.setLocale(NUM_LOCALE)
         self.setButtonSymbols(QAbstractSpinBox.ButtonSymbols.UpDownArrows)
 
     def focusInEvent(self, event):
@@ -73,10 +93,9 @@ class SmartIntSpin(QSpinBox):
         QTimer.singleShot(0, self.selectAll)
 
 # ─────────────────────────────────────────────
-#  STYLESHEET
+#  STYLESHEET  (built once at import)
 # ─────────────────────────────────────────────
-def stylesheet() -> str:
-    return f"""
+STYLESHEET = f"""
     QMainWindow, QWidget {{
         background: {BG_DARK};
         color: {TEXT};
@@ -261,62 +280,146 @@ class MortgageCalc:
         self.rate2_start_month  = rate2_start_month
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def _payment(balance: float, monthly_rate: float, remaining_months: int) -> float:
         if monthly_rate == 0:
             return balance / remaining_months
         r, n = monthly_rate, remaining_months
-        return balance * r * (1 + r) ** n / ((1 + r) ** n - 1)
-
-    def simulate(self) -> list[dict]:
-        balance = self.principal
-        mr1     = self.annual_rate / 12 / 100
+        f = (1 + r) ** n
+        return balance * r * f / (f - 1)
 
-        # Fixed initial payment (standard amortisation)
-        fixed_pmt = self._payment(balance, mr1, self.term_months)
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _growth(monthly_rate: float, months: int) -> np.ndarray:
+        """gⁿ − 1 for n = 1..months, g = 1 + r.  Shared (read-only) by every
+        schedule at this rate: base, overpaid, scenarios and target probes."""
+        gm1 = np.expm1(np.arange(1, months + 1) * np.log1p(monthly_rate))
+        gm1.setflags(write=False)
+        return gm1
 
-        schedule  = []
-        for m in range(1, self.term_months + 1):
-            if balance <= 0:
-                break
+    @staticmethod
+    def _step(balance: float, monthly_rate: float, pmt: float, extra: float) -> tuple:
+        """One month of the scalar recurrence, including the payoff clamps."""
+        interest       = balance * monthly_rate
+        principal_part = max(0.0, pmt - interest)
+        actual_extra   = min(extra, max(0.0, balance - principal_part))
+        return (interest, principal_part, actual_extra,
+                max(0.0, balance - principal_part - actual_extra))
 
+    @staticmethod
+    def _amortise(principal: float, annual_rate: float, term_months: int,
+                  monthly_overpay: float, lump_sums: dict,
+                  rate2: float = None, rate2_start_month: int = None) -> dict:
+        """Vectorised amortisation returning one NumPy column per field.
+
+        Between events (rate switch, lump sum) the balance follows the closed
+        form  B_n = B_0·gⁿ − (P + O)·(gⁿ − 1)/r  with g = 1 + r, so each run of
+        ordinary months is computed in a single pass.  Only event months and
+        the payoff month are stepped one at a time.
+        """
+        cols = {k: np.empty(term_months) for k in
+                ("payment", "principal", "interest", "balance", "overpayment", "fixed_pmt")}
+        switch  = rate2 is not None and rate2_start_month is not None
+        events  = sorted(m for m in set(lump_sums) | ({rate2_start_month} if switch else set())
+                         if 1 <= m <= term_months)
+        balance = principal
+        mr      = annual_rate / 12 / 100
+        pmt     = MortgageCalc._payment(balance, mr, term_months)
+        op      = monthly_overpay
+
+        def step(i: int, extra: float):
+            nonlocal balance
+            interest, pp, actual, balance = MortgageCalc._step(balance, mr, pmt, extra)
+            cols["payment"][i]     = pmt + actual
+            cols["principal"][i]   = pp + actual
+            cols["interest"][i]    = interest
+            cols["balance"][i]     = balance
+            cols["overpayment"][i] = actual
+            cols["fixed_pmt"][i]   = pmt
+
+        m = 1                                   # next month to simulate
+        while m <= term_months and balance > 0:
             # Switch to variable rate: recalculate payment on remaining balance/term
-            if (self.rate2 is not None and
-                    self.rate2_start_month is not None and
-                    m == self.rate2_start_month):
-                mr1       = self.rate2 / 12 / 100
-                remaining = self.term_months - m + 1
-                fixed_pmt = self._payment(balance, mr1, remaining)
-
-            mr       = mr1
-            interest = balance * mr
-
-            # How much of the fixed payment goes to principal
-            principal_part = max(0.0, fixed_pmt - interest)
-
-            # Overpayment (cannot overpay more than remaining balance)
-            extra = self.monthly_overpay + self.lump_sums.get(m, 0.0)
-            actual_extra = min(extra, max(0.0, balance - principal_part))
-
-            total_pmt = fixed_pmt + actual_extra
-            balance   = max(0.0, balance - principal_part - actual_extra)
-
-            pmt_date  = self.start_date + relativedelta(months=m - 1)
-            schedule.append({
-                "month":       m,
-                "date":        pmt_date,
-                "payment":     total_pmt,
-                "principal":   principal_part + actual_extra,
-                "interest":    interest,
-                "balance":     balance,
-                "overpayment": actual_extra,
-                "fixed_pmt":   fixed_pmt,
-            })
-            if balance == 0.0:
-                break
+            if switch and m == rate2_start_month:
+                mr  = rate2 / 12 / 100
+                pmt = MortgageCalc._payment(balance, mr, term_months - m + 1)
+
+            if m in lump_sums:
+                step(m - 1, op + lump_sums[m])
+                m += 1
+                continue
+
+            # Closed-form run up to (not including) the next event: the
+            # no-overpayment balance, less the compounded overpayments
+            span = next((e for e in events if e > m), term_months + 1) - m
+            if mr == 0:
+                acc = np.arange(1, span + 1, dtype=float)
+                bal = balance - pmt * acc - op * acc
+            else:
+                gm1 = MortgageCalc._growth(mr, term_months)[:span]      # gⁿ − 1
+                acc = gm1 / mr                                        # Σ gᵏ, k < n
+                bal = balance * (1 + gm1) - pmt * acc - op * acc
+            prev = np.concatenate(([balance], bal[:-1]))
+            intr = prev * mr
+
+            # Months where neither clamp applies follow the closed form exactly
+            regular = (intr <= pmt) & (bal > 0)
+            k = span if regular.all() else int(np.argmin(regular))
+            i = m - 1
+            cols["payment"][i:i + k]     = pmt + op
+            cols["principal"][i:i + k]   = pmt - intr[:k] + op
+            cols["interest"][i:i + k]    = intr[:k]
+            cols["balance"][i:i + k]     = bal[:k]
+            cols["overpayment"][i:i + k] = op
+            cols["fixed_pmt"][i:i + k]   = pmt
+            if k:
+                balance = bal[k - 1]
+            m += k
+            if k < span:
+                step(m - 1, op)
+                m += 1
+
+        return {k: v[:m - 1] for k, v in cols.items()}
 
-        return schedule
+    @staticmethod
+    def _month_dates(start: date, n: int) -> np.ndarray:
+        """start + k months for k = 0..n-1, with the day clamped to the end of
+        shorter months (31 Jan -> 28/29 Feb), as calendar month stepping does."""
+        months = np.datetime64(start, "M") + np.arange(n)
+        first  = months.astype("datetime64[D]")
+        length = ((months + 1).astype("datetime64[D]") - first).astype(int)
+        return first + (np.minimum(start.day, length) - 1)
 
-    def simulate_base(self) -> list[dict]:
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _simulate_cached(principal: float, annual_rate: float, term_months: int,
+                         start_date: date, monthly_overpay: float, lump_sums: tuple,
+                         rate2: float, rate2_start_month: int) -> dict:
+        """Memoised schedule.  The arrays are shared between callers, so they
+        are returned read-only."""
+        sched = MortgageCalc._amortise(principal, annual_rate, term_months,
+                                       monthly_overpay, dict(lump_sums),
+                                       rate2, rate2_start_month)
+        n = len(sched["balance"])
+        sched["month"] = np.arange(1, n + 1)
+        sched["date"]  = MortgageCalc._month_dates(start_date, n)
+        for col in sched.values():
+            col.setflags(write=False)
+        return sched
+
+    def simulate(self) -> dict:
+        """Schedule as parallel NumPy columns (month, date, payment, principal,
+        interest, balance, overpayment, fixed_pmt), one entry per month.
+
+        Money and rate inputs are rounded to the 2 d.p. the spinboxes allow so
+        repeated calls with the same inputs hit the cache."""
+        return self._simulate_cached(
+            round(self.principal, 2), round(self.annual_rate, 2), self.term_months,
+            self.start_date, round(self.monthly_overpay, 2),
+            tuple(sorted((m, round(a, 2)) for m, a in self.lump_sums.items())),
+            None if self.rate2 is None else round(self.rate2, 2), self.rate2_start_month)
+
+    def simulate_base(self) -> dict:
         """Simulate without any overpayments (baseline for comparison)."""
         orig_op, orig_ls       = self.monthly_overpay, self.lump_sums
         self.monthly_overpay   = 0.0
@@ -326,6 +429,18 @@ class MortgageCalc:
         self.lump_sums         = orig_ls
         return result
 
+    @staticmethod
+    def summary(sched: dict) -> dict:
+        """Headline totals for a schedule, computed once and shared by the tabs."""
+        n = len(sched["month"])
+        return {
+            "payments":  n,
+            "fixed_pmt": sched["fixed_pmt"][0] if n else 0.0,
+            "total":     sched["payment"].sum(),
+            "interest":  sched["interest"].sum(),
+            "payoff":    sched["date"][-1].item() if n else None,
+        }
+
     @staticmethod
     def stamp_duty(price: float, is_first_buyer: bool = False,
                    is_additional: bool = False) -> float:
@@ -351,13 +466,17 @@ class MortgageCalc:
     def overpayment_for_target(principal, annual_rate, term_months, start_date,
                                 target_months: int,
                                 rate2=None, rate2_start=None) -> float:
-        """Binary search: monthly overpayment needed to pay off in target_months."""
+        """Binary search: monthly overpayment needed to pay off in target_months.
+
+        Probes go straight to the engine so they don't flood the schedule cache."""
         lo, hi = 0.0, principal
         for _ in range(60):
-            mid  = (lo + hi) / 2
-            calc = MortgageCalc(principal, annual_rate, term_months, start_date, mid,
-                                rate2=rate2, rate2_start_month=rate2_start)
-            if len(calc.simulate()) <= target_months:
+            if hi - lo < 1e-6:              # well below the 2 d.p. we report
+                break
+            mid   = (lo + hi) / 2
+            sched = MortgageCalc._amortise(principal, annual_rate, term_months, mid, {},
+                                           rate2, rate2_start)
+            if len(sched["balance"]) <= target_months:
                 hi = mid
             else:
                 lo = mid
@@ -370,10 +489,33 @@ class ChartCanvas(FigureCanvas):
     def __init__(self, parent=None, figsize=(8, 3.8)):
         self.fig, self.ax = Figure(figsize=figsize, facecolor=CARD_BG), None
         self.ax = self.fig.add_subplot(111, facecolor=CARD_BG)
+        self.lines = []             # persistent Line2D artists, reused via set_data
+        self._bg   = None           # cached background for blitting self.lines
         super().__init__(self.fig)
         self.setParent(parent)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self._style()
+        self.mpl_connect("draw_event", self._on_draw)
+
+    def _on_draw(self, event):
+        """After every full draw (including resizes) cache the background
+        without the animated lines, then paint the lines on top."""
+        if not self.lines or not all(l.get_animated() for l in self.lines):
+            self._bg = None
+            return
+        self._bg = self.copy_from_bbox(self.fig.bbox)
+        for line in self.lines:
+            self.ax.draw_artist(line)
+
+    def blit_lines(self):
+        """Repaint only the animated lines over the cached background."""
+        if self._bg is None:
+            self.draw_idle()
+            return
+        self.restore_region(self._bg)
+        for line in self.lines:
+            self.ax.draw_artist(line)
+        self.blit(self.fig.bbox)
 
     def _style(self):
         self.ax.tick_params(colors=TEXT_DIM, labelsize=10)
@@ -386,6 +528,8 @@ class ChartCanvas(FigureCanvas):
     def clear(self):
         self.ax.cla()
         self.ax.set_facecolor(CARD_BG)
+        self.lines = []
+        self._bg   = None
         self._style()
 
     def fmt_currency(self):
@@ -567,9 +711,12 @@ class Sidebar(QScrollArea):
         return w
 
     def _update_ltv(self):
-        loan = max(0, self.price.value() - self.deposit.value())
-        ltv  = loan / self.price.value() * 100 if self.price.value() else 0
+        price = self.price.value()
+        loan  = max(0, price - self.deposit.value())
+        ltv   = loan / price * 100 if price else 0
         self.ltv_lbl.setText(f"LTV: {ltv:.1f}%  |  Loan: £{loan:,.0f}")
+        # Validate as the inputs change rather than when Calculate is pressed
+        self.b_calc.setEnabled(loan > 0)
 
     def _update_sd(self):
         if not self.chk_sd.isChecked(): return
@@ -587,12 +734,14 @@ class Sidebar(QScrollArea):
         self._lump_lay.addWidget(lbl)
 
     def get_params(self) -> dict:
-        loan = max(0, self.price.value() - self.deposit.value())
-        sd   = self.start_dt.date()
-        r2   = self.rate2.value() if self.chk_rate2.isChecked() else None
-        r2m  = int(self.fix_yrs.value() * 12) if self.chk_rate2.isChecked() else None
+        price   = self.price.value()
+        deposit = self.deposit.value()
+        sd      = self.start_dt.date()
+        var     = self.chk_rate2.isChecked()
+        r2      = self.rate2.value() if var else None
+        r2m     = int(self.fix_yrs.value() * 12) if var else None
         return dict(
-            principal       = loan,
+            principal       = max(0, price - deposit),
             annual_rate     = self.rate.value(),
             term_months     = int(self.term_yrs.value() * 12),
             start_date      = date(sd.year(), sd.month(), sd.day()),
@@ -600,20 +749,20 @@ class Sidebar(QScrollArea):
             lump_sums       = list(self._lumps),
             rate2           = r2,
             rate2_start_month = r2m,
-            price           = self.price.value(),
-            deposit         = self.deposit.value(),
+            price           = price,
+            deposit         = deposit,
         )
 
     def _save(self):
         p = QFileDialog.getSaveFileName(self, "Save Session", "", "JSON (*.json)")[0]
         if not p: return
         d = self.get_params(); d["start_date"] = d["start_date"].isoformat()
-        with open(p, "w") as f: json.dump(d, f, indent=2)
+        with open(p, "wb") as f: f.write(_dumps(d))
 
     def _load(self):
         p = QFileDialog.getOpenFileName(self, "Load Session", "", "JSON (*.json)")[0]
         if not p: return
-        with open(p) as f: d = json.load(f)
+        with open(p, "rb") as f: d = _loads(f.read())
         self.price.setValue(d.get("price", 350_000))
         self.deposit.setValue(d.get("deposit", 50_000))
         self.rate.setValue(d.get("annual_rate", 4.5))
@@ -627,7 +776,7 @@ class Sidebar(QScrollArea):
         p = os.path.join(os.path.dirname(__file__), "initial.json")
         if not os.path.exists(p): return
         try:
-            with open(p) as f: d = json.load(f)
+            with open(p, "rb") as f: d = _loads(f.read())
             self.price.setValue(d.get("price", d.get("property_price", 350_000)))
             dep  = d.get("deposit", 0)
             loan = d.get("principal", d.get("loan_amount", 0))
@@ -644,15 +793,18 @@ class Sidebar(QScrollArea):
 # ─────────────────────────────────────────────
 #  CHART DRAWING FUNCTIONS
 # ─────────────────────────────────────────────
-def draw_balance(canvas: ChartCanvas, base: list, op: list):
+def draw_balance(canvas: ChartCanvas, base: dict, op: dict):
     canvas.clear()
     ax = canvas.ax
-    db = [r["date"] for r in base]; bb = [r["balance"] for r in base]
-    do = [r["date"] for r in op];   bo = [r["balance"] for r in op]
-    ax.fill_between(db, bb, alpha=0.08, color=TEXT_DIM)
-    ax.plot(db, bb, color=TEXT_DIM, lw=1.5, ls="--", label="No overpayment")
+    db, bb = base["date"], base["balance"]
+    do, bo = op["date"],   op["balance"]
+    same = base is op          # no overpayments: one trace, no overdraw
+    if not same:
+        ax.fill_between(db, bb, alpha=0.08, color=TEXT_DIM)
+        ax.plot(db, bb, color=TEXT_DIM, lw=1.5, ls="--", label="No overpayment")
     ax.fill_between(do, bo, alpha=0.15, color=ACCENT)
-    ax.plot(do, bo, color=ACCENT, lw=2.2, label="With overpayment")
+    ax.plot(do, bo, color=ACCENT, lw=2.2,
+            label="No overpayment" if same else "With overpayment")
     if len(do) < len(db):
         ax.axvline(do[-1], color=GREEN, lw=1.2, ls=":", alpha=0.8)
         ax.annotate("Early payoff", xy=(do[-1], 0), xytext=(12, 32),
@@ -660,100 +812,123 @@ def draw_balance(canvas: ChartCanvas, base: list, op: list):
                     arrowprops=dict(arrowstyle="->", color=GREEN, lw=0.8))
     ax.set_title("Outstanding Balance Over Time", color=TEXT, fontsize=12, pad=8)
     ax.legend(facecolor=PANEL_BG, labelcolor=TEXT, framealpha=0.9, fontsize=10, edgecolor=BORDER)
-    canvas.fmt_currency(); canvas.fig.tight_layout(pad=1.6); canvas.draw()
+    canvas.fmt_currency(); canvas.fig.tight_layout(pad=1.6); canvas.draw_idle()
 
 
-def draw_equity(canvas: ChartCanvas, price: float, base: list, op: list):
+def draw_equity(canvas: ChartCanvas, price: float, base: dict, op: dict):
     canvas.clear(); ax = canvas.ax
-    db = [r["date"] for r in base]; eb = [price - r["balance"] for r in base]
-    do = [r["date"] for r in op];   eo = [price - r["balance"] for r in op]
-    ax.fill_between(db, eb, alpha=0.08, color=YELLOW)
-    ax.plot(db, eb, color=YELLOW, lw=1.5, ls="--", label="Equity (base)")
+    do, eo = op["date"], price - op["balance"]
+    same = base is op
+    if not same:
+        db, eb = base["date"], price - base["balance"]
+        ax.fill_between(db, eb, alpha=0.08, color=YELLOW)
+        ax.plot(db, eb, color=YELLOW, lw=1.5, ls="--", label="Equity (base)")
     ax.fill_between(do, eo, alpha=0.15, color=GREEN)
-    ax.plot(do, eo, color=GREEN, lw=2.2, label="Equity (w/ overpay)")
+    ax.plot(do, eo, color=GREEN, lw=2.2,
+            label="Equity" if same else "Equity (w/ overpay)")
     ax.axhline(price, color=ACCENT2, lw=1, ls=":", alpha=0.5)
     ax.set_title("Equity Built Over Time", color=TEXT, fontsize=12, pad=8)
     ax.legend(facecolor=PANEL_BG, labelcolor=TEXT, framealpha=0.9, fontsize=10, edgecolor=BORDER)
-    canvas.fmt_currency(); canvas.fig.tight_layout(pad=1.6); canvas.draw()
+    canvas.fmt_currency(); canvas.fig.tight_layout(pad=1.6); canvas.draw_idle()
 
 
-def draw_composition(canvas: ChartCanvas, op: list):
+def draw_composition(canvas: ChartCanvas, op: dict):
     canvas.clear(); ax = canvas.ax
-    dates = [r["date"] for r in op]
-    intr  = [r["interest"]    for r in op]
-    prin  = [r["principal"]   for r in op]
-    xtra  = [r["overpayment"] for r in op]
-    ax.stackplot(dates, intr, prin, xtra,
+    ax.stackplot(op["date"], op["interest"], op["principal"], op["overpayment"],
                  labels=["Interest", "Principal", "Overpayment"],
                  colors=[ACCENT2, ACCENT, GREEN], alpha=0.88)
     ax.set_title("Monthly Payment Composition", color=TEXT, fontsize=12, pad=8)
     ax.legend(facecolor=PANEL_BG, labelcolor=TEXT, framealpha=0.9, fontsize=10,
               edgecolor=BORDER, loc="upper right")
-    canvas.fmt_currency(); canvas.fig.tight_layout(pad=1.6); canvas.draw()
+    canvas.fmt_currency(); canvas.fig.tight_layout(pad=1.6); canvas.draw_idle()
 
 
-def draw_annual(canvas: DualChartCanvas, base: list, op: list):
+def draw_annual(canvas: DualChartCanvas, base: dict, op: dict):
     canvas.clear()
-    def ann(sched):
-        y: dict = {}
-        for r in sched:
-            yr = r["date"].year
-            if yr not in y: y[yr] = {"i": 0, "p": 0}
-            y[yr]["i"] += r["interest"]
-            y[yr]["p"] += r["principal"]
-        return y
-    yb, yo = ann(base), ann(op)
-    years  = sorted(set(yb) | set(yo))
-    x = np.arange(len(years)); w = 0.38
+    # Annual interest per calendar year, summed in one bincount per schedule
+    yrs_b = base["date"].astype("datetime64[Y]").astype(int)
+    yrs_o = op["date"].astype("datetime64[Y]").astype(int)
+    y0    = min(yrs_b[0], yrs_o[0])
+    ny    = max(yrs_b[-1], yrs_o[-1]) - y0 + 1
+    ib    = np.bincount(yrs_b - y0, weights=base["interest"], minlength=ny)
+    io    = np.bincount(yrs_o - y0, weights=op["interest"],   minlength=ny)
+    years = np.arange(y0, y0 + ny) + 1970
+    x = np.arange(ny); w = 0.38
 
     # left: interest comparison
     ax1 = canvas.ax1
-    ax1.bar(x - w/2, [yb.get(y, {}).get("i", 0) for y in years], w, color=TEXT_DIM, alpha=0.65, label="Base")
-    ax1.bar(x + w/2, [yo.get(y, {}).get("i", 0) for y in years], w, color=ACCENT2, alpha=0.9, label="w/ overpay")
-    ax1.set_xticks(x); ax1.set_xticklabels([str(y) for y in years], rotation=50, ha="right", fontsize=8)
+    same = base is op          # no overpayments: one series, no overdraw
+    if same:
+        ax1.bar(x, io, 2 * w, color=ACCENT2, alpha=0.9, label="Interest")
+    else:
+        ax1.bar(x - w/2, ib, w, color=TEXT_DIM, alpha=0.65, label="Base")
+        ax1.bar(x + w/2, io, w, color=ACCENT2, alpha=0.9, label="w/ overpay")
+    ax1.set_xticks(x); ax1.set_xticklabels(years.astype(str), rotation=50, ha="right", fontsize=8)
     ax1.set_title("Annual Interest Paid", color=TEXT, fontsize=11, pad=6)
     ax1.legend(facecolor=PANEL_BG, labelcolor=TEXT, framealpha=0.9, fontsize=9, edgecolor=BORDER)
     canvas.fmt_currency(ax1)
 
     # right: cumulative savings
     ax2 = canvas.ax2
-    cum_b = np.cumsum([sum(r["interest"] for r in base if r["date"].year <= y) for y in years])
-    cum_o = np.cumsum([sum(r["interest"] for r in op   if r["date"].year <= y) for y in years])
-    # simpler: cumulative over schedule
-    cb = np.cumsum([r["interest"] for r in base])
-    co_dates = [r["date"] for r in op]
-    cb_dates = [r["date"] for r in base]
-    ax2.plot(cb_dates, cb, color=TEXT_DIM, lw=1.5, ls="--", label="Cumulative interest (base)")
-    ax2.plot(co_dates, np.cumsum([r["interest"] for r in op]),
-             color=GREEN, lw=2.2, label="Cumulative interest (w/ overpay)")
+    if same:
+        ax2.plot(op["date"], np.cumsum(op["interest"]),
+                 color=GREEN, lw=2.2, label="Cumulative interest")
+    else:
+        ax2.plot(base["date"], np.cumsum(base["interest"]),
+                 color=TEXT_DIM, lw=1.5, ls="--", label="Cumulative interest (base)")
+        ax2.plot(op["date"], np.cumsum(op["interest"]),
+                 color=GREEN, lw=2.2, label="Cumulative interest (w/ overpay)")
     ax2.set_title("Cumulative Interest", color=TEXT, fontsize=11, pad=6)
     ax2.legend(facecolor=PANEL_BG, labelcolor=TEXT, framealpha=0.9, fontsize=9, edgecolor=BORDER)
     canvas.fmt_currency(ax2)
-    canvas.fig.tight_layout(pad=1.6); canvas.draw()
+    canvas.fig.tight_layout(pad=1.6); canvas.draw_idle()
 
 
-def draw_savings(canvas: ChartCanvas, base: list, op: list):
+def draw_savings(canvas: ChartCanvas, base: dict, op: dict):
     canvas.clear(); ax = canvas.ax
-    db = [r["date"] for r in base]; cb = np.cumsum([r["payment"] for r in base])
-    do = [r["date"] for r in op];   co = np.cumsum([r["payment"] for r in op])
-    ax.plot(db, cb, color=TEXT_DIM, lw=1.5, ls="--", label="Total paid (base)")
-    ax.plot(do, co, color=GREEN,    lw=2.2, label="Total paid (w/ overpay)")
-    n = min(len(base), len(op))
-    savings = [cb[i] - co[i] for i in range(n)]
-    ax.fill_between(do[:n], savings, alpha=0.12, color=GREEN)
+    do, co = op["date"], np.cumsum(op["payment"])
+    if base is op:
+        ax.plot(do, co, color=GREEN, lw=2.2, label="Total paid")
+    else:
+        db, cb = base["date"], np.cumsum(base["payment"])
+        ax.plot(db, cb, color=TEXT_DIM, lw=1.5, ls="--", label="Total paid (base)")
+        ax.plot(do, co, color=GREEN,    lw=2.2, label="Total paid (w/ overpay)")
+        n = min(len(cb), len(co))
+        savings = cb[:n] - co[:n]
+        ax.fill_between(do[:n], savings, alpha=0.12, color=GREEN)
     ax.set_title("Cumulative Total Cost vs Savings", color=TEXT, fontsize=12, pad=8)
     ax.legend(facecolor=PANEL_BG, labelcolor=TEXT, framealpha=0.9, fontsize=10, edgecolor=BORDER)
-    canvas.fmt_currency(); canvas.fig.tight_layout(pad=1.6); canvas.draw()
+    canvas.fmt_currency(); canvas.fig.tight_layout(pad=1.6); canvas.draw_idle()
 
 
-def draw_scenarios(canvas: ChartCanvas, scenarios: list[tuple[str, list]]):
-    canvas.clear(); ax = canvas.ax
-    for i, (label, sched) in enumerate(scenarios):
-        ax.plot([r["date"] for r in sched], [r["balance"] for r in sched],
-                color=CHART_COLORS[i % len(CHART_COLORS)], lw=2.0, label=label)
-    ax.set_title("Overpayment Scenarios — Balance", color=TEXT, fontsize=12, pad=8)
+def draw_scenarios(canvas: ChartCanvas, scenarios: list[tuple[str, dict]]):
+    ax = canvas.ax
+    # Y range pinned to the opening balance so reruns with the same loan keep
+    # identical axes and can be blitted
+    opening = round(max(s["balance"][0] + s["principal"][0] for _, s in scenarios), 2)
+    if len(canvas.lines) != len(scenarios):
+        # First draw: build the axes and one line per scenario
+        canvas.clear()
+        canvas.lines = [
+            ax.plot(sched["date"], sched["balance"], animated=True,
+                    color=CHART_COLORS[i % len(CHART_COLORS)], lw=2.0, label=label)[0]
+            for i, (label, sched) in enumerate(scenarios)]
+        ax.set_title("Overpayment Scenarios — Balance", color=TEXT, fontsize=12, pad=8)
+        ax.set_ylim(0, opening * 1.05)
+        canvas.fmt_currency()
+    else:
+        # Re-runs only swap the data on the existing lines
+        before = (ax.get_xlim(), ax.get_ylim(), [l.get_label() for l in canvas.lines])
+        for line, (label, sched) in zip(canvas.lines, scenarios):
+            line.set_data(sched["date"], sched["balance"])
+            line.set_label(label)
+        ax.relim(); ax.autoscale_view(scaley=False)
+        ax.set_ylim(0, opening * 1.05)
+        if before == (ax.get_xlim(), ax.get_ylim(), [l.get_label() for l in canvas.lines]):
+            canvas.blit_lines()     # axes, ticks and legend unchanged
+            return
     ax.legend(facecolor=PANEL_BG, labelcolor=TEXT, framealpha=0.9, fontsize=10, edgecolor=BORDER)
-    canvas.fmt_currency(); canvas.fig.tight_layout(pad=1.6); canvas.draw()
+    canvas.fig.tight_layout(pad=1.6); canvas.draw_idle()
 
 # ─────────────────────────────────────────────
 #  DASHBOARD TAB
@@ -782,14 +957,13 @@ class DashboardTab(QWidget):
             c    = ChartCanvas(figsize=figsize); setattr(self, canvas_attr, c)
             cl.addWidget(c); root.addWidget(card, stretch=1)
 
-    def refresh(self, params, base, op):
-        pmt    = op[0]["fixed_pmt"] if op else 0
-        total  = sum(r["payment"]  for r in op)
-        intr   = sum(r["interest"] for r in op)
-        b_intr = sum(r["interest"] for r in base)
-        saving = max(0, b_intr - intr)
-        months = max(0, len(base) - len(op))
-        payoff = op[-1]["date"].strftime("%b %Y") if op else "—"
+    def refresh(self, params, base, op, s_base, s_op):
+        pmt    = s_op["fixed_pmt"]
+        total  = s_op["total"]
+        intr   = s_op["interest"]
+        saving = max(0, s_base["interest"] - intr)
+        months = max(0, s_base["payments"] - s_op["payments"])
+        payoff = s_op["payoff"].strftime("%b %Y") if s_op["payoff"] else "—"
         self.kpi_pmt.update(f"£{pmt:,.0f}")
         self.kpi_total.update(f"£{total:,.0f}")
         self.kpi_intr.update(f"£{intr:,.0f}")
@@ -901,9 +1075,10 @@ class ScenariosTab(QWidget):
                                p["rate2"], p["rate2_start_month"])
             s = c.simulate()
             scenarios.append((f"£{ov:,.0f}/mo", s))
-            mo_saved = p["term_months"] - len(s)
-            intr     = sum(r["interest"] for r in s)
-            payoff   = s[-1]["date"].strftime("%b %Y")
+            sm       = MortgageCalc.summary(s)
+            mo_saved = p["term_months"] - sm["payments"]
+            intr     = sm["interest"]
+            payoff   = sm["payoff"].strftime("%b %Y")
             self._scards[i].update(f"£{ov:,.0f}/mo",
                 f"Payoff {payoff} | -{mo_saved}mo | Interest £{intr:,.0f}")
         draw_scenarios(self.sc_canvas, scenarios)
@@ -923,7 +1098,7 @@ class ScenariosTab(QWidget):
 class ScheduleTab(QWidget):
     def __init__(self):
         super().__init__()
-        self._sched = []
+        self._sched = None
         root = QVBoxLayout(self)
         root.setContentsMargins(18, 14, 18, 14); root.setSpacing(10)
 
@@ -946,50 +1121,96 @@ class ScheduleTab(QWidget):
         self.table.setStyleSheet(f"QTableWidget {{ alternate-background-color: {PANEL_BG}; }}")
         root.addWidget(self.table, stretch=1)
 
-    def refresh(self, sched: list):
+    def refresh(self, sched: dict, summ: dict):
         self._sched = sched
-        self.table.setRowCount(len(sched))
-        tp = sum(r["payment"]  for r in sched)
-        ti = sum(r["interest"] for r in sched)
-        self.summary.setText(f"{len(sched)} payments  |  Total paid: £{tp:,.0f}  |  Total interest: £{ti:,.0f}")
+        n, tp, ti = summ["payments"], summ["total"], summ["interest"]
+        self.table.setRowCount(n)
+        self.summary.setText(f"{n} payments  |  Total paid: £{tp:,.0f}  |  Total interest: £{ti:,.0f}")
 
         def item(txt, right=True):
             it = QTableWidgetItem(txt)
             if right: it.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
             return it
 
-        for i, r in enumerate(sched):
-            self.table.setItem(i, 0, item(str(r["month"]), False))
-            self.table.setItem(i, 1, item(r["date"].strftime("%b %Y"), False))
-            self.table.setItem(i, 2, item(f"£{r['payment']:,.2f}"))
-            self.table.setItem(i, 3, item(f"£{r['principal']:,.2f}"))
-            self.table.setItem(i, 4, item(f"£{r['interest']:,.2f}"))
-            self.table.setItem(i, 5, item(f"£{r['overpayment']:,.2f}"))
-            self.table.setItem(i, 6, item(f"£{r['balance']:,.2f}"))
+        rows = zip(sched["month"].tolist(), sched["date"].astype(object),
+                   sched["payment"].tolist(), sched["principal"].tolist(),
+                   sched["interest"].tolist(), sched["overpayment"].tolist(),
+                   sched["balance"].tolist())
+        for i, (mo, dt, pay, prin, intr, xtra, bal) in enumerate(rows):
+            self.table.setItem(i, 0, item(str(mo), False))
+            self.table.setItem(i, 1, item(dt.strftime("%b %Y"), False))
+            self.table.setItem(i, 2, item(f"£{pay:,.2f}"))
+            self.table.setItem(i, 3, item(f"£{prin:,.2f}"))
+            self.table.setItem(i, 4, item(f"£{intr:,.2f}"))
+            self.table.setItem(i, 5, item(f"£{xtra:,.2f}"))
+            self.table.setItem(i, 6, item(f"£{bal:,.2f}"))
 
     def _export(self):
-        if not self._sched: return
+        if not self._sched or not len(self._sched["month"]): return
         p = QFileDialog.getSaveFileName(self, "Export Schedule", "amortisation.csv", "CSV (*.csv)")[0]
         if not p: return
+        import csv                  # only needed for export
         with open(p, "w", newline="") as f:
             w = csv.writer(f)
             w.writerow(["Month", "Date", "Payment", "Principal", "Interest", "Overpayment", "Balance"])
-            for r in self._sched:
-                w.writerow([r["month"], r["date"].isoformat(),
-                             round(r["payment"],2), round(r["principal"],2),
-                             round(r["interest"],2), round(r["overpayment"],2),
-                             round(r["balance"],2)])
+            s = self._sched
+            money = ([round(v, 2) for v in s[k].tolist()]
+                     for k in ("payment", "principal", "interest", "overpayment", "balance"))
+            w.writerows(zip(s["month"].tolist(), s["date"].astype(str).tolist(), *money))
+
+# ─────────────────────────────────────────────
+#  BACKGROUND SIMULATION
+# ─────────────────────────────────────────────
+class _JobSignals(QObject):
+    finished = pyqtSignal(int, object, object, object, object)  # generation, base, op, summaries
+    failed   = pyqtSignal(int, str)              # generation, message
+
+
+class SimulateJob(QRunnable):
+    """Runs the overpaid and baseline simulations on a pool thread; results
+    are marshalled back to the GUI thread through queued signals."""
+
+    def __init__(self, generation: int, params: dict):
+        super().__init__()
+        self.generation = generation
+        self.params     = params
+        self.signals    = _JobSignals()
+
+    def run(self):
+        p = self.params
+        try:
+            calc = MortgageCalc(
+                p["principal"], p["annual_rate"], p["term_months"],
+                p["start_date"], p["monthly_overpay"], p["lump_sums"],
+                p["rate2"], p["rate2_start_month"])
+            op = calc.simulate()
+
+            # Without overpayments the baseline is the same schedule
+            base   = calc.simulate_base() if p["monthly_overpay"] > 0 or p["lump_sums"] else op
+            s_op   = MortgageCalc.summary(op)
+            s_base = s_op if base is op else MortgageCalc.summary(base)
+            self.signals.finished.emit(self.generation, base, op, s_base, s_op)
+        except Exception as ex:
+            self.signals.failed.emit(self.generation, str(ex))
 
 # ─────────────────────────────────────────────
 #  MAIN WINDOW
 # ─────────────────────────────────────────────
 class MortgageApp(QMainWindow):
+    _STATUS_TMPL = ("Done  |  Payoff: {payoff:%b %Y}  |  {payments} payments  |  "
+                    "{saved} months saved ({saved_y}y {saved_m}m)")
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Mortgage Overpayment Dashboard")
         self.resize(1420, 860)
         self.setMinimumSize(1100, 680)
         self._dark_titlebar()
+        self._last_key = None        # inputs of the last successful calculation
+        self._generation = 0         # bumped per submitted job; stale results are dropped
+        self._pending    = None      # (key, params) of the job in flight
+        self._last_status = ""       # status text for the results on screen
+        self._job        = None
 
         root = QWidget(); self.setCentralWidget(root)
         ml   = QHBoxLayout(root); ml.setContentsMargins(0, 0, 0, 0); ml.setSpacing(0)
@@ -1037,48 +1258,71 @@ class MortgageApp(QMainWindow):
         except Exception:
             pass
 
+    @staticmethod
+    def _params_key(params: dict) -> tuple:
+        return tuple((k, tuple((ls["month"], ls["amount"]) for ls in v) if k == "lump_sums" else v)
+                     for k, v in params.items())
+
     def _calculate(self):
+        params = self.sidebar.get_params()
+        if params["principal"] <= 0:
+            QMessageBox.warning(self, "Input error", "Loan amount must be greater than zero.")
+            return
+        key = self._params_key(params)
+        if self._pending and key == self._pending[0]:
+            return                       # already being calculated
+        if key == self._last_key:
+            if self._pending:
+                # Back to the inputs on screen: drop the job for the other inputs
+                self._generation += 1
+                self._pending = None
+                self.status.setText(self._last_status)
+            return                       # nothing changed since the results on screen
+        self.status.setText("Calculating…")
+
+        self._generation += 1
+        self._pending = (key, params)
+        self._job = SimulateJob(self._generation, params)
+        self._job.signals.finished.connect(self._on_results)
+        self._job.signals.failed.connect(self._on_error)
+        QThreadPool.globalInstance().start(self._job)
+
+    def _on_results(self, generation: int, base: dict, op: dict, s_base: dict, s_op: dict):
+        if generation != self._generation:
+            return                       # superseded by a newer calculation
+        key, params = self._pending
+        self._pending = None
         try:
-            params = self.sidebar.get_params()
-            if params["principal"] <= 0:
-                QMessageBox.warning(self, "Input error", "Loan amount must be greater than zero.")
-                return
-            self.status.setText("Calculating…")
-            QApplication.processEvents()
-
-            calc_base = MortgageCalc(
-                params["principal"], params["annual_rate"], params["term_months"],
-                params["start_date"],
-                rate2=params["rate2"], rate2_start_month=params["rate2_start_month"])
-            base = calc_base.simulate_base()
-
-            calc_op = MortgageCalc(
-                params["principal"], params["annual_rate"], params["term_months"],
-                params["start_date"], params["monthly_overpay"], params["lump_sums"],
-                params["rate2"], params["rate2_start_month"])
-            op = calc_op.simulate()
-
-            self.t_dash.refresh(params, base, op)
+            self.t_dash.refresh(params, base, op, s_base, s_op)
             self.t_anal.refresh(base, op)
             self.t_scen.set_params(params); self.t_scen._run()
-            self.t_sched.refresh(op)
-
-            months_saved = len(base) - len(op)
-            payoff = op[-1]["date"].strftime("%b %Y")
-            self.status.setText(
-                f"Done  |  Payoff: {payoff}  |  {len(op)} payments  |  "
-                f"{months_saved} months saved ({months_saved//12}y {months_saved%12}m)"
-            )
+            self.t_sched.refresh(op, s_op)
+
+            saved = s_base["payments"] - s_op["payments"]
+            self._last_status = self._STATUS_TMPL.format_map(
+                dict(s_op, saved=saved, saved_y=saved // 12, saved_m=saved % 12))
+            self.status.setText(self._last_status)
+            self._last_key = key
         except Exception as ex:
-            QMessageBox.critical(self, "Error", str(ex))
-            self.status.setText("Error — check inputs")
+            self._show_error(str(ex))
+
+    def _on_error(self, generation: int, msg: str):
+        if generation != self._generation:
+            return
+        self._pending = None
+        self._show_error(msg)
+
+    def _show_error(self, msg: str):
+        self._last_key = None
+        QMessageBox.critical(self, "Error", msg)
+        self.status.setText("Error — check inputs")
 
 # ─────────────────────────────────────────────
 #  ENTRY POINT
 # ─────────────────────────────────────────────
 def main():
     app = QApplication(sys.argv)
-    app.setStyleSheet(stylesheet())
+    app.setStyleSheet(STYLESHEET)
     win = MortgageApp()
     win.show()
     sys.exit(app.exec())